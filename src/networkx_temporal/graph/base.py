@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 from typing import Any, Callable, Optional, Union
-from warnings import warn
 
 import networkx as nx
 
@@ -36,6 +35,19 @@ from ..transform import (
 from ..typing import StaticGraph, TemporalGraph
 from ..utils.convert import convert
 
+VOID_METHODS = {
+    "add_node",
+    "add_nodes_from",
+    "add_weighted_edges_from",
+    "clear",
+    "clear_edges",
+    "remove_edge",
+    "remove_edges_from",
+    "remove_node",
+    "remove_nodes_from",
+    "update",
+}
+
 
 class TemporalBase(metaclass=ABCMeta):
     """
@@ -76,9 +88,9 @@ class TemporalBase(metaclass=ABCMeta):
 
     @abstractmethod
     def __init__(self, t: Optional[int] = None, directed: bool = None, multigraph: bool = None):
-        graph = getattr(nx, f"{'Multi' if multigraph else ''}{'Di' if directed else ''}Graph")
-        self.data = [graph() for _ in range(t or 1)]
-        _wrapper_networkx(self, graph)
+        self._graph_class = getattr(nx, f"{'Multi' if multigraph else ''}{'Di' if directed else ''}Graph")
+        self.data = [self._graph_class() for _ in range(t or 1)]
+        _wrapper_networkx(type(self), self._graph_class)
 
     def __getitem__(self, t: Union[str, int, slice]) -> StaticGraph:
         """ Returns snapshot from a given interval. """
@@ -138,7 +150,7 @@ class TemporalBase(metaclass=ABCMeta):
         """
         Setter for the ``data`` property of the temporal graph.
         """
-        if type(data) in (nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph):
+        if isinstance(data, nx.Graph) and not isinstance(data, TemporalBase):
             data = [data]
 
         assert type(data) in (dict, list, tuple),\
@@ -147,7 +159,7 @@ class TemporalBase(metaclass=ABCMeta):
         names = list(data.keys()) if type(data) == dict else None
         data = list(data.values() if type(data) == dict else data)
 
-        assert all(type(G) in (nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph) for G in data),\
+        assert all(isinstance(G, nx.Graph) and not isinstance(G, TemporalBase) for G in data),\
             "All elements in data must be valid NetworkX graphs."
 
         self._data = data
@@ -238,13 +250,14 @@ class TemporalBase(metaclass=ABCMeta):
         directed = self.is_directed()
         multigraph = self.is_multigraph()
 
+        # Match current snapshots, as data may be replaced after construction.
         if G is None:
-            G = getattr(nx, f"{'Multi' if multigraph else ''}{'Di' if directed else ''}Graph")()
+            G = self[0].__class__()
 
         assert type(index) == int,\
             f"Argument `index` must be an integer, received: {type(index)}."
 
-        assert type(G) in (nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph),\
+        assert isinstance(G, nx.Graph) and not isinstance(G, TemporalBase),\
             f"Argument `G` must be a valid NetworkX graph, received: {type(G)}."
 
         assert G.is_directed() == directed,\
@@ -265,17 +278,7 @@ class TemporalBase(metaclass=ABCMeta):
         :param interval: Range to consider. Optional. Defaults to all snapshots.
             Accepts either a ``range`` or a ``tuple`` of integers.
         """
-        assert interval is None or type(interval) in (range, tuple),\
-            "Argument `interval` must be a range or tuple of integers."
-
-        if interval is None:
-            interval = range(len(self))
-
-        elif type(interval) == tuple:
-            interval = range(*interval)
-
-        print(edge)
-        return [i for i in (interval or range(len(self))) if self[i].has_edge(*edge)]
+        return _index_snapshots(self, lambda G: G.has_edge(*edge), interval)
 
     def index_node(self, node: Any, interval: Optional[range] = None) -> list:
         """
@@ -285,16 +288,7 @@ class TemporalBase(metaclass=ABCMeta):
         :param interval: Range to consider. Optional. Defaults to all snapshots.
             Accepts either a ``range`` or a ``tuple`` of integers.
         """
-        assert interval is None or type(interval) in (range, tuple),\
-            "Argument `interval` must be a range or tuple of integers."
-
-        if interval is None:
-            interval = range(len(self))
-
-        elif type(interval) == tuple:
-            interval = range(*interval)
-
-        return [i for i in (interval or range(len(self))) if self[i].has_node(node)]
+        return _index_snapshots(self, lambda G: G.has_node(node), interval)
 
     def pop(self, index: Optional[int] = None) -> StaticGraph:
         """
@@ -308,15 +302,43 @@ class TemporalBase(metaclass=ABCMeta):
         return self.data.pop(index or -1)
 
 
-def _decorator_networkx(cls, method: str) -> Callable:
+def _index_snapshots(TG, func: Callable, interval: Optional[Union[range, tuple]] = None) -> list:
+    """ Returns index of snapshots within interval for which a function returns ``True``. """
+    assert interval is None or type(interval) in (range, tuple),\
+        "Argument `interval` must be a range or tuple of integers."
+
+    if type(interval) == tuple:
+        interval = range(*interval)
+
+    interval = interval or range(len(TG))
+
+    # Check bounds from range ends, as ranges may also be decreasing.
+    if interval:
+        first, last = sorted((interval[0], interval[-1]))
+        assert -len(TG) <= first and last < len(TG),\
+            f"Received interval {interval.start, interval.stop}, but temporal graph has {len(TG)} snapshots."
+
+    # Check snapshots directly, validating the interval only once.
+    data = TG.data
+    return [i for i in interval if func(data[i])]
+
+
+def _decorator_networkx(method: str, void: bool = False) -> Callable:
     """
     Decorator for static NetworkX graph methods.
 
     Returns a list of values returned by calling the method on each snapshot in the temporal graph.
     If all returned values are `None` or a boolean, returns a single element instead of a list.
+    Methods known to always return `None` are called on each snapshot without storing values.
     """
-    def func(*args, **kwargs):
-        returns = list(G.__getattribute__(method)(*args, **kwargs) for G in cls)
+    if void:
+        def func(self, *args, **kwargs):
+            for G in self:
+                G.__getattribute__(method)(*args, **kwargs)
+        return func
+
+    def func(self, *args, **kwargs):
+        returns = list(G.__getattribute__(method)(*args, **kwargs) for G in self)
         if all(r is None for r in returns):
             return None
         if all(r is True for r in returns):
@@ -327,13 +349,25 @@ def _decorator_networkx(cls, method: str) -> Callable:
     return func
 
 
-def _wrapper_networkx(cls, G: StaticGraph) -> None:
+def _wrapper_networkx(cls, graph_class: type) -> None:
     """
     Wrapper for decorating static NetworkX graph methods.
+
+    Methods are set once on the temporal graph class, instead of on every new instance.
     """
-    for method in dir(G):
-        if method not in dir(TemporalBase) and not method.startswith("__"):
-            try:
-                cls.__setattr__(method, _decorator_networkx(cls, method))
-            except AttributeError:  # networkx<2.8.1
-                warn("NetworkX version <2.8.1 detected, inherited methods will be undocumented.")
+    if cls.__dict__.get("_wrapped_networkx", False):
+        return
+
+    methods = set(dir(TemporalBase))
+
+    # Multigraphs return edge keys when adding edges.
+    void = VOID_METHODS if issubclass(graph_class, nx.MultiGraph) else VOID_METHODS | {"add_edge", "add_edges_from"}
+
+    for method in dir(graph_class):
+        if method not in methods and not method.startswith("__"):
+            func = _decorator_networkx(method, void=method in void)
+            func.__name__ = method
+            func.__doc__ = getattr(graph_class, method).__doc__
+            setattr(cls, method, func)
+
+    cls._wrapped_networkx = True
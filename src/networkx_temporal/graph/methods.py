@@ -51,7 +51,7 @@ def _neighbors(self: TemporalGraph, node: Any) -> list:
 
     :meta private:
     """
-    return list(list(G.neighbors(node)) if G.has_node(node) else [] for G in self)
+    return [list(G[node]) if node in G else [] for G in self]
 
 
 def _to_directed(self: TemporalGraph, as_view: Optional[bool] = True) -> TemporalGraph:
@@ -112,18 +112,22 @@ def slice(
     """
     assert self.data,\
         "Temporal graph is empty."
-    assert sum(self.order()),\
+    assert any(G.order() for G in self),\
         "Temporal graph has no nodes."
-    assert sum(self.size()),\
+    assert any(G.size() for G in self),\
         "Temporal graph has no edges."
     assert attr is not None or bins is not None,\
         "Argument `bins` must be set if `attr` is unset."
     assert bins is None or (type(bins) == int and bins > 0),\
         "Argument `bins` must be a positive integer if set."
 
+    # Obtain static graph object and edge data.
+    G = self.to_static()
+    edge_list = list(G.edges(keys=True) if G.is_multigraph() else G.edges())
+
     # Automatically set `level` if `attr` is not a string.
     if attr is not None and type(attr) != str:
-        order, size = self.temporal_order(), self.temporal_size()
+        order, size = G.order(), self.temporal_size()
 
         assert hasattr(attr, "__len__"),\
             f"Attribute data must be a list, dictionary or sequence of elements, received: {type(attr)}."
@@ -144,10 +148,6 @@ def slice(
     else:
         level = "edge"
 
-    # Obtain static graph object and edge data.
-    G = self.to_static()
-    edges = pd.DataFrame(G.edges(keys=True) if G.is_multigraph() else G.edges())
-
     # Obtain edge- or node-level attribute data.
     if attr is None:
         times = pd.Series(
@@ -164,6 +164,9 @@ def slice(
     elif type(attr) == dict:
         times = pd.Series(attr)
 
+    elif type(attr) == pd.Series and level == "edge":
+        times = attr
+
     elif type(attr) == pd.DataFrame:
         assert attr.shape[1] == 1,\
             f"Data frame for attribute data must have a single column, received: {attr.shape[1]}."
@@ -184,7 +187,7 @@ def slice(
             f"Attribute does not exist at {level} level or contains null values only."
         assert fillna is not None,\
             f"Found null value(s) in attribute data, but `fillna` has not been set."
-        times.fillna(fillna, inplace=True)
+        times = times.fillna(fillna)
 
     # Apply function to time attribute values.
     if apply_func is not None:
@@ -192,6 +195,7 @@ def slice(
 
     # Obtain initial edge temporal values from node-level data.
     if level == "node":
+        edges = pd.DataFrame(edge_list)
         times = edges[node_column].apply(times.get)
 
         # Obtain node-level (source or target) cut to consider for time bins.
@@ -216,7 +220,7 @@ def slice(
     # Factorize to ensure strings can be binned,
     # e.g., sortable dates in 'YYYY-MM-DD' format.
     cats = None
-    if times.dtype.__str__() == "object":
+    if pd.api.types.is_string_dtype(times.dtype):
         factorize, cats = pd.factorize(times, sort=sort)
         times = pd.Series(factorize, index=times.index)
 
@@ -248,14 +252,16 @@ def slice(
     if level == "node":
         times = edges[node_column].apply(times.get)
 
+    # Bucket edge positions by time interval with a single stable sort
+    # of factorized codes, instead of grouping edges by their values.
+    codes, uniques = pd.factorize(times, sort=True)
+    index = codes.argsort(kind="stable")
+    bounds = codes[index].searchsorted(range(len(uniques) + 1))
+
     # Create temporal graph snapshots.
     graphs = [
-        G.edge_subgraph(
-            edges
-            .iloc[index]
-            .apply(lambda e: (e[0], e[1], e[2]) if self.is_multigraph() else (e[0], e[1]), axis=1)
-        )
-        for index in edges.groupby(times, observed=False).groups.values()
+        G.edge_subgraph(edge_list[j] for j in index[bounds[i]:bounds[i+1]])
+        for i in range(len(uniques))
     ]
 
     # Create copies instead of views.
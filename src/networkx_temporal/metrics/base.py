@@ -1,6 +1,8 @@
-from functools import reduce
-from operator import or_
-from typing import Any, Optional, Union
+from collections import Counter
+from itertools import chain
+from typing import Any, Iterable, Optional, Union
+
+from ..utils import is_static_graph
 
 
 def temporal_degree(
@@ -16,7 +18,7 @@ def temporal_degree(
 
     :note: Available both as a function and as a method from :class:`~networkx_temporal.graph.TemporalGraph` objects.
     """
-    return _to_dict(reduce(_reduce_sum, self.degree(nbunch=nbunch, weight=weight)))
+    return _temporal_degree(self, "degree", nbunch=nbunch, weight=weight)
 
 
 def temporal_in_degree(
@@ -32,7 +34,7 @@ def temporal_in_degree(
 
     :note: Available both as a function and as a method from :class:`~networkx_temporal.graph.TemporalGraph` objects.
     """
-    return _to_dict(reduce(_reduce_sum, self.in_degree(nbunch=nbunch, weight=weight)))
+    return _temporal_degree(self, "in_degree", nbunch=nbunch, weight=weight)
 
 
 def temporal_out_degree(
@@ -48,7 +50,7 @@ def temporal_out_degree(
 
     :note: Available both as a function and as a method from :class:`~networkx_temporal.graph.TemporalGraph` objects.
     """
-    return _to_dict(reduce(_reduce_sum, self.out_degree(nbunch=nbunch, weight=weight)))
+    return _temporal_degree(self, "out_degree", nbunch=nbunch, weight=weight)
 
 
 def temporal_neighbors(self, node: Any) -> list:
@@ -59,7 +61,7 @@ def temporal_neighbors(self, node: Any) -> list:
 
     :note: Available both as a function and as a method from :class:`~networkx_temporal.graph.TemporalGraph` objects.
     """
-    return list(reduce(or_, iter(set(N) for N in self.neighbors(node))))
+    return list(set().union(*self.neighbors(node)))
 
 
 def temporal_nodes(self, *args, **kwargs) -> list:
@@ -68,7 +70,7 @@ def temporal_nodes(self, *args, **kwargs) -> list:
 
     :note: Available both as a function and as a method from :class:`~networkx_temporal.graph.TemporalGraph` objects.
     """
-    return list(set.union(*[set(G.nodes(*args, **kwargs)) for G in self]))
+    return list(set().union(*(G.nodes(*args, **kwargs) for G in self)))
 
 
 def temporal_edges(self, *args, **kwargs) -> list:
@@ -77,7 +79,7 @@ def temporal_edges(self, *args, **kwargs) -> list:
 
     :note: Available both as a function and as a method from :class:`~networkx_temporal.graph.TemporalGraph` objects.
     """
-    return list(e for G in self for e in G.edges(*args, **kwargs))
+    return list(chain.from_iterable(G.edges(*args, **kwargs) for G in self))
 
 
 def temporal_order(self) -> int:
@@ -88,7 +90,7 @@ def temporal_order(self) -> int:
 
     :note: Available both as a function and as a method from :class:`~networkx_temporal.graph.TemporalGraph` objects.
     """
-    return len(self.temporal_nodes())
+    return len(set().union(*(G.nodes() for G in self)))
 
 
 def temporal_size(self) -> int:
@@ -99,7 +101,7 @@ def temporal_size(self) -> int:
 
     :note: Available both as a function and as a method from :class:`~networkx_temporal.graph.TemporalGraph` objects.
     """
-    return len(self.temporal_edges())
+    return sum(len(G.edges()) for G in self)
 
 
 def total_order(self) -> int:
@@ -125,13 +127,33 @@ def total_size(self) -> int:
     return sum(self.size())
 
 
-def _reduce_sum(d1: Union[int, dict], d2: Union[int, dict]):
-    """ Returns sum of two integers or dictionaries. """
-    if type(d1) == int or type(d2) == int:
-        return (d1 if type(d1) == int else 0) + (d2 if type(d2) == int else 0)
+def _temporal_degree(
+    TG,
+    degree: str,
+    nbunch: Optional[Any] = None,
+    weight: Optional[str] = None
+) -> Union[dict, int]:
+    """ Returns node degrees from a given degree view method considering all snapshots. """
+    if is_static_graph(TG):
+        return _to_dict(getattr(TG, degree)(nbunch=nbunch, weight=weight))
+
+    # Single node: sum scalar degrees from snapshots where it is present.
+    if nbunch is not None:
+        degrees = [getattr(G, degree)(nbunch, weight=weight) for G in TG if nbunch in G]
+        if degrees:
+            return sum(degrees)
+
+    return _sum_degrees(getattr(G, degree)(nbunch=nbunch, weight=weight) for G in TG)
+
+
+def _sum_degrees(degrees: Iterable) -> dict:
+    """ Returns sum of node degrees from all snapshots. """
+    total = Counter()
+
+    for d in degrees:
+        total.update(dict(d))
 
-    d1, d2 = dict(d1), dict(d2)
-    return {v: d1.get(v, 0) + d2.get(v, 0) for v in set(d for d in {**d1, **d2})}
+    return dict(total)
 
 
 def _to_dict(deg: Union[dict, int, float]) -> dict:
@@ -57,7 +57,7 @@ def from_events(
             multigraph = 1 != max(Counter((e[:2] for e in events)).values())
 
         TG = temporal_graph(directed=directed, multigraph=multigraph)
-        list(TG.add_edge(u, v, time=t) for u, v, t in events)
+        TG[0].add_edges_from((u, v, {"time": t}) for u, v, t in events)
 
     elif len(events[0]) == 4 and type(events[0][-1]) == int:
         t_max = 1 + max(events, key=lambda x: x[2])[2]
@@ -65,7 +65,7 @@ def from_events(
 
         for u, v, t, e in events:
             if e == 1:
-                temporal_edges[(u, v)] = temporal_edges.get((u, v), []) + [range(t, t_max)]
+                temporal_edges.setdefault((u, v), []).append(range(t, t_max))
             elif e == -1:
                 temporal_edges[(u, v)][-1] = range(temporal_edges[(u, v)][-1].start, t)
             else:
@@ -75,7 +75,9 @@ def from_events(
             multigraph = any(len(ranges) > 1 or len(ranges[0]) > 1 for ranges in temporal_edges.values())
 
         TG = temporal_graph(directed=directed, multigraph=multigraph)
-        list(TG.add_edge(u, v, time=t) for (u, v), ranges in temporal_edges.items() for r in ranges for t in r)
+        TG[0].add_edges_from(
+            (u, v, {"time": t}) for (u, v), ranges in temporal_edges.items() for r in ranges for t in r
+        )
 
     elif len(events[0]) == 4 and type(events[0][-1]) == float:
 
@@ -137,49 +139,59 @@ def to_events(
         f"Argument `eps` must be either `int` or `float` if provided."
     assert attr is None or type(attr) == str,\
         f"Argument `attr` must be a string if provided."
-    assert attr is None or not any(TG.is_multigraph(on_each=True)),\
+    assert attr is None or not any(G.is_multigraph() for G in TG),\
         "Edge attributes are not supported when converting multigraphs to events; " \
         "consider calling the `slice` method or converting it with `from_multigraph` beforehand."
     # Filtered (frozen) multigraphs produce inconsistent results. [networkx/networkx#7724]
     assert not any(G.is_multigraph() and nx.is_frozen(G) for G in TG),\
         "Frozen multigraphs are not supported; consider calling the `copy` method beforehand."
 
-    # 3-tuples of format: (u, v, t).
-    if not eps:
-        return [(e[0], e[1], t) for t, G in enumerate(TG) for e in G.edges()]
-
-    # 4-tuples of format: (u, v, t, int_edge_addition_or_deletion).
     if eps == int:
-        events = []
-        for t in range(len(TG)):
-            if t == 0:
-                for edge in TG[0].edges():
-                    events.append((*edge, t, 1))
-            else:
-                for edge in TG[t].edges():
-                    if not TG[t-1].has_edge(*edge):
-                        events.append((*edge, t, 1))
-                for edge in TG[t-1].edges():
-                    if not TG[t].has_edge(*edge):
-                        events.append((*edge, t, -1))
-
-    # 4-tuples of format: (u, v, t, float_edge_duration).
+        return _to_events_int(TG)
+
     if eps == float:
-        events = []
-
-        for i in range(len(TG)):
-            for u, v, start in TG[i].edges(data=attr, default=i):
-                if i == 0 or not TG[i-1].has_edge(u, v):
-                    for j in range(i+1, len(TG)):
-                        if not TG[j].has_edge(u, v):
-                            end = TG[j-1].edges[u, v].get(attr, j) if attr else j
-                            events.append((u, v, start, float(end - start - 1)))
-                            break
-                        if j == len(TG) - 1:
-                            end = TG[j-1].edges[u, v].get(attr, j) if attr else j
-                            events.append((u, v, start, float(end - start)))
-                            break
-                    if i == len(TG) - 1:
-                        events.append((u, v, start, 0.0))
+        return _to_events_float(TG, attr=attr)
+
+    return _to_events_tuple(TG)
+
+
+def _to_events_tuple(TG: TemporalGraph) -> list:
+    """ Returns 3-tuples of format: (u, v, t). """
+    return [(e[0], e[1], t) for t, G in enumerate(TG) for e in G.edges()]
+
+
+def _to_events_int(TG: TemporalGraph) -> list:
+    """ Returns 4-tuples of format: (u, v, t, int_edge_addition_or_deletion). """
+    events, edges, keys = [], [], set()
+    key = tuple if TG[0].is_directed() else frozenset
+
+    # Compare hashable edge sets of consecutive snapshots
+    # instead of calling `has_edge` for every edge.
+    for t, G in enumerate(TG):
+        prev_edges, prev_keys = edges, keys
+        edges = list(G.edges())
+        keys = set(map(key, edges))
+        events.extend((*edge, t, 1) for edge in edges if key(edge) not in prev_keys)
+        events.extend((*edge, t, -1) for edge in prev_edges if key(edge) not in keys)
+
+    return events
+
 
+def _to_events_float(TG: TemporalGraph, attr: Optional[str] = None) -> list:
+    """ Returns 4-tuples of format: (u, v, t, float_edge_duration). """
+    events = []
+    for i in range(len(TG)):
+        for u, v, start in TG[i].edges(data=attr, default=i):
+            if i == 0 or not TG[i-1].has_edge(u, v):
+                for j in range(i+1, len(TG)):
+                    if not TG[j].has_edge(u, v):
+                        end = TG[j-1].edges[u, v].get(attr, j) if attr else j
+                        events.append((u, v, start, float(end - start - 1)))
+                        break
+                    if j == len(TG) - 1:
+                        end = TG[j-1].edges[u, v].get(attr, j) if attr else j
+                        events.append((u, v, start, float(end - start)))
+                        break
+                if i == len(TG) - 1:
+                    events.append((u, v, start, 0.0))
     return events
@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import Optional, Union
 
 import networkx as nx
@@ -59,12 +60,12 @@ def to_static(
 
     :note: Available both as a function and as a method from :class:`~networkx_temporal.graph.TemporalGraph` objects.
     """
-    assert attr is None or sum(TG.size()) == 0 or attr not in next(iter(TG[0].edges(data=True)))[-1],\
-        f"Edge attribute '{attr}' already exists in graph."
-
     if is_static_graph(TG):
         return convert(TG, to) if to else TG
 
+    assert attr is None or sum(TG.size()) == 0 or attr not in next(iter(TG[0].edges(data=True)))[-1],\
+        f"Edge attribute '{attr}' already exists in graph."
+
     if len(TG) == 1:
         return convert(TG[0], to) if to else TG[0]
 
@@ -76,12 +77,12 @@ def to_static(
 
     G = getattr(nx, f"{'Multi' if multigraph else ''}{'Di' if directed else ''}Graph")()
 
-    list(G.add_nodes_from(nodes)
-         for nodes in TG.nodes(data=True))
+    G.add_nodes_from(chain.from_iterable(TG.nodes(data=True)))
 
-    list(G.add_edges_from(
-         [(e[0], e[1], {**e[2], **({attr: t} if attr else {})}) for e in edges])
-         for t, edges in enumerate(TG.edges(data=True)))
+    G.add_edges_from(chain.from_iterable(
+        ((u, v, {**d, attr: t} if attr else d) for u, v, d in edges)
+        for t, edges in enumerate(TG.edges(data=True))
+    ))
 
     G.name = TG.name
     return convert(G, to) if to else G
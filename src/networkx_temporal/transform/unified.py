@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import Optional, Union
 
 import networkx as nx
@@ -25,18 +26,20 @@ def from_unified(UTG: StaticGraph) -> TemporalGraph:
     """
     temporal_nodes = {}
 
+    # Split each node label only once, mapping it to its original name.
     for node in UTG.nodes():
-        t = node.rsplit("_", 1)[-1]
+        label = node.rsplit("_", 1)
+        t = label[-1]
 
         assert t.isdigit(),\
             f"Unified temporal graph (UTG) contains non-temporal nodes ('{node}')."
 
-        temporal_nodes[t] = temporal_nodes.get(t, []) + [node]
+        temporal_nodes.setdefault(t, {})[node] = label[0]
 
     return from_snapshots([
         nx.relabel_nodes(
             UTG.subgraph(temporal_nodes[t]),
-            {v: v.rsplit("_", 1)[0] for v in temporal_nodes[t]}
+            temporal_nodes[t]
         )
         for t in sorted(temporal_nodes.keys(), key=int)
     ])
@@ -90,38 +93,43 @@ def to_unified(
 
     # Create graph with intra-slice nodes and edges,
     # relabeling nodes to include temporal index.
-    UTG = nx.compose_all([
-        nx.relabel_nodes(
-            TG[t],
-            {
-                v:
-                    relabel_nodes[t].get(v, f"{v}_{t}")
-                    if type(relabel_nodes) == list else
-                    relabel_nodes.get(v, f"{v}_{t}")
-                    if type(relabel_nodes) == dict else
-                    f"{v}_{t}"
-                for v in TG[t].nodes()
-            }
+    UTG = TG[0].__class__()
+
+    for t in T:
+        mapping = {
+            v:
+                relabel_nodes[t].get(v, f"{v}_{t}")
+                if type(relabel_nodes) == list else
+                relabel_nodes.get(v, f"{v}_{t}")
+                if type(relabel_nodes) == dict else
+                f"{v}_{t}"
+            for v in TG[t].nodes()
+        }
+        UTG.graph.update(TG[t].graph)
+        UTG.add_nodes_from((mapping[v], data) for v, data in TG[t].nodes(data=True))
+        UTG.add_edges_from(
+            (mapping[u], mapping[v], *data)
+            for u, v, *data in (
+                TG[t].edges(keys=True, data=True) if TG[t].is_multigraph() else TG[t].edges(data=True)
+            )
         )
-        for t in T
-    ])
 
-    # Add inter-slice couplings among temporal nodes.
+    # Add inter-slice couplings among temporal nodes, finding the
+    # next appearance of each node in a single backward sweep.
     if add_couplings:
-        for i in range(len(T)-1):
-            for node in TG[T[i]].nodes():
-                if UTG.has_node(f"{node}_{T[i]}"):
-                    for j in range(i+1, len(T)):
-                        if UTG.has_node(f"{node}_{T[j]}"):
-                            UTG.add_edge(f"{node}_{T[i]}", f"{node}_{T[j]}")
-                            break
+        couplings, next_seen = [], {}
+        for t in reversed(T):
+            nodes = [node for node in TG[t].nodes() if UTG.has_node(f"{node}_{t}")]
+            couplings.append([(f"{node}_{t}", f"{node}_{next_seen[node]}") for node in nodes if node in next_seen])
+            next_seen.update((node, t) for node in nodes)
+        UTG.add_edges_from(chain.from_iterable(reversed(couplings)))
 
     # Add temporal node indices as attributes.
     if node_index:
-        node_index = [str(v) for v in node_index]
+        node_index = {str(v): i for i, v in enumerate(node_index)}
         nx.set_node_attributes(
             UTG,
-            {node: node_index.index(node.rsplit("_", 1)[0]) for node in UTG.nodes()},
+            {node: node_index[node.rsplit("_", 1)[0]] for node in UTG.nodes()},
             "node_index"
         )
 
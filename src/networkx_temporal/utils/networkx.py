@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import Any, Union
 
 import networkx as nx
@@ -63,13 +64,13 @@ def is_frozen(G: Union[TemporalGraph, StaticGraph], on_each: bool = False) -> bo
     :param object G: :class:`~networkx_temporal.graph.TemporalGraph` or static NetworkX graph object.
     :param bool on_each: If ``True``, checks all snapshots for the graph type.
     """
-    assert is_temporal_graph(graph) or is_static_graph(TG),\
-        "Argument `graph` must be a temporal graph or a static graph."
+    assert is_temporal_graph(G) or is_static_graph(G),\
+        "Argument `G` must be a temporal graph or a static graph."
 
-    if is_static_graph(graph):
-        return nx.is_frozen(graph)
+    if is_static_graph(G):
+        return nx.is_frozen(G)
 
-    return [nx.is_frozen(G) for G in graph] if on_each else nx.is_frozen(graph[0])
+    return [nx.is_frozen(H) for H in G] if on_each else nx.is_frozen(G[0])
 
 
 def is_static_graph(G: Any) -> bool:
@@ -137,9 +138,9 @@ def _from_multigraph(G: nx.MultiGraph) -> StaticGraph:
     H = getattr(nx, f"{f'Di' if G.is_directed() else ''}Graph")()
     H.add_edges_from(G.edges(data=True))
 
-    weight = {}
+    weight = Counter()
     for u, v, w in G.edges(data="weight", default=1):
-        weight[(u, v)] = weight.get((u, v), 0) + w
+        weight[(u, v)] += w
 
     nx.set_edge_attributes(H, weight, "weight")
     return H
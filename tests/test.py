@@ -6,7 +6,9 @@ from io import BytesIO
 from os import remove
 from typing import Optional
 
+import networkx as nx
 import networkx_temporal as tx
+import pandas as pd
 from networkx_temporal.typing import Literal
 from networkx_temporal.utils.convert import FORMATS
 
@@ -22,6 +24,7 @@ def test_networkx_temporal(log_level: Optional[str] = None, convert: list = [])
     assert TG.is_directed()
     assert TG.is_multigraph()
     assert tx.is_temporal_graph(TG)
+    assert not tx.is_frozen(TG)
     assert not tx.from_multigraph(TG).is_multigraph()
     assert tx.to_multigraph(tx.from_multigraph(TG)).is_multigraph()
     assert type(TG) == tx.TemporalMultiDiGraph
@@ -44,6 +47,8 @@ def test_networkx_temporal(log_level: Optional[str] = None, convert: list = [])
     order = TG.order()
     size = TG.size()
     assert len(TG) == 4
+    assert tx.is_frozen(TG)
+    assert tx.is_frozen(TG, on_each=True) == [True, True, True, True]
     assert len(TG.slice(bins=2)) == 2
     assert TG.order() == [2, 3, 4, 4]
     assert TG.size() == [1, 2, 3, 3]
@@ -52,7 +57,20 @@ def test_networkx_temporal(log_level: Optional[str] = None, convert: list = [])
     assert TG.temporal_size() == TG.total_size() == 9
     assert TG.temporal_degree() == {"a": 4, "b": 4, "c": 3, "d": 2, "e": 2, "f": 3}
     assert TG.temporal_degree("a") == 4
+    assert tx.from_snapshots([nx.Graph([(1, 2)]), nx.Graph([(2, 3)])]).temporal_degree(1) == 1
+    assert tx.metrics.temporal_degree(nx.DiGraph([(1, 2)])) == {1: 1, 2: 1}
+    assert tx.metrics.temporal_in_degree(nx.DiGraph([(1, 2)])) == {1: 0, 2: 1}
+    TG_ = tx.TemporalGraph()
+    TG_.data = [nx.DiGraph([(1, 2)])]
+    TG_.append()
+    assert TG_.is_directed(on_each=True) == [True, True]
+    TG_ = tx.temporal_graph(multigraph=False)
+    TG_.add_edges_from([(1, 2), (2, 3), (3, 4), (4, 1), (1, 3)])
+    times = pd.Series([0, None, 1, 1, 2], index=range(100, 105))
+    assert TG_.slice(attr=times, fillna=0).size() == [2, 2, 1]
+    assert times.isna().sum() == 1
     assert TG.temporal_neighbors("c") == ["b"]
+    assert sorted(TG.to_undirected().temporal_neighbors("c")) == ["a", "b", "d"]
     assert not TG.to_undirected().is_directed()
     assert TG.to_directed().is_directed()
     assert order == TG.order()
@@ -117,6 +135,9 @@ def test_networkx_temporal(log_level: Optional[str] = None, convert: list = [])
     TG_ = tx.from_events(ETG)
     assert TG.order() == TG_.order()
     assert TG.size() == TG_.size()
+    assert tx.to_events(nx.Graph([(1, 2)]), eps=int) == [(1, 2, 0, 1)]
+    assert tx.to_static(nx.Graph([(1, 2)]), attr="x").size() == 1
+    assert tx.to_events(nx.Graph([(1, 2, {"t": 2})]), eps="float", attr="t") == [(1, 2, 2, 0.0)]
 
     # TG -> UTG -> TG
     log.info("TG -> UTG -> TG")